@@ -19,5 +19,20 @@ if not DATABASE_URI:
 SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+# Configure the connection pool explicitly so throughput doesn't queue on
+# the default pool of 5, and pre-ping so stale connections are replaced
+# instead of surfacing as 500s after a database restart.
+# File-based SQLite (used for local test runs) manages its own
+# connections, so the pool arguments only apply to Postgres.
+SQLALCHEMY_ENGINE_OPTIONS = {}
+if DATABASE_URI.startswith("postgresql"):
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("DATABASE_POOL_SIZE", "10")),
+        "max_overflow": int(os.getenv("DATABASE_MAX_OVERFLOW", "20")),
+        "pool_timeout": int(os.getenv("DATABASE_POOL_TIMEOUT", "30")),
+        "pool_pre_ping": True,
+        "pool_recycle": int(os.getenv("DATABASE_POOL_RECYCLE", "1800")),
+    }
+
 # Secret for session management
 SECRET_KEY = os.getenv("SECRET_KEY", "s3cr3t-key-shhhh")
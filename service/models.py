@@ -4,8 +4,15 @@ Models for Account
 All of the models are stored in this module
 """
 import logging
-from datetime import date
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Optional
 from flask_sqlalchemy import SQLAlchemy
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import select
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import func
 
 logger = logging.getLogger("flask.app")
 
@@ -22,36 +29,116 @@ def init_db(app):
     Account.init_db(app)
 
 
+@contextmanager
+def unit_of_work():
+    """Defers the commit until the end of the block
+
+    Mutator methods called inside the block flush instead of committing,
+    so a handler that performs several writes pays for one commit instead
+    of one per write. Any error rolls the whole block back.
+
+        with unit_of_work():
+            account.create()
+            other.delete()
+    """
+    session = db.session()
+    session.info["uow_depth"] = session.info.get("uow_depth", 0) + 1
+    try:
+        yield session
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.info["uow_depth"] -= 1
+    if not session.info["uow_depth"]:
+        session.commit()
+
+
+class AccountSchema(BaseModel):
+    """Typed validation schema for Account payloads
+
+    Compiled once at import by pydantic-core, which validates and coerces
+    the payload (including the ISO date) in native code instead of a
+    Python attribute loop.
+    """
+
+    name: str
+    email: str
+    address: str
+    phone_number: Optional[str] = None
+    date_joined: Optional[date] = None
+
+
+# Process-local cache of serialized rows keyed on (id, updated_at). A
+# write changes updated_at, so a stale entry can never be served; LRU
+# eviction caps how many rows stay pinned in memory.
+_SERIALIZE_CACHE_MAX = 1024
+_serialize_cache = OrderedDict()
+
+
 ######################################################################
 #  P E R S I S T E N T   B A S E   M O D E L
 ######################################################################
 class PersistentBase:
     """Base class added persistent methods"""
 
-    def __init__(self):
-        self.id = None  # pylint: disable=invalid-name
+    @staticmethod
+    def _save():
+        """Flushes inside a unit_of_work, otherwise commits immediately"""
+        if db.session.info.get("uow_depth"):
+            db.session.flush()
+        else:
+            db.session.commit()
 
     def create(self):
         """
         Creates a Account to the database
         """
-        logger.info("Creating %s", self.name)
-        self.id = None  # id must be none to generate next primary key
+        logger.debug("Creating %s", self.name)
         db.session.add(self)
-        db.session.commit()
+        self._save()
+
+    @classmethod
+    def create_all(cls, items):
+        """
+        Creates a batch of records with a single commit
+
+        Args:
+            items (list): the instances to persist
+        """
+        logger.debug("Creating %d %ss", len(items), cls.__name__)
+        for item in items:
+            item.id = None  # id must be none to generate next primary key
+        db.session.add_all(items)
+        cls._save()
+
+    @classmethod
+    def bulk_save(cls, items):
+        """
+        Persists a batch of records without ORM bookkeeping
+
+        Faster than create_all() but the instances are not refreshed
+        with their generated ids.
+
+        Args:
+            items (list): the instances to persist
+        """
+        logger.debug("Bulk saving %d %ss", len(items), cls.__name__)
+        db.session.bulk_save_objects(items, return_defaults=False)
+        cls._save()
 
     def update(self):
         """
         Updates a Account to the database
         """
-        logger.info("Updating %s", self.name)
-        db.session.commit()
+        logger.debug("Updating %s", self.name)
+        self._save()
 
     def delete(self):
         """Removes a Account from the data store"""
-        logger.info("Deleting %s", self.name)
+        logger.debug("Deleting %s", self.name)
         db.session.delete(self)
-        db.session.commit()
+        self._save()
 
     @classmethod
     def init_db(cls, app):
@@ -64,16 +151,36 @@ class PersistentBase:
         db.create_all()  # make our sqlalchemy tables
 
     @classmethod
-    def all(cls):
-        """Returns all of the records in the database"""
-        logger.info("Processing all records")
-        return cls.query.all()
+    def all(cls, columns=None):
+        """Returns all of the records in the database
+
+        Args:
+            columns (list): restrict hydration to these columns (optional);
+                the other attributes load lazily if touched
+        """
+        logger.debug("Processing all records")
+        query = cls.query
+        if columns:
+            query = query.options(load_only(*columns))
+        return query.all()
 
     @classmethod
     def find(cls, by_id):
         """Finds a record by it's ID"""
-        logger.info("Processing lookup for id %s ...", by_id)
-        return cls.query.get(by_id)
+        logger.debug("Processing lookup for id %s ...", by_id)
+        # session.get() consults the identity map before querying so a
+        # repeated lookup within a session is a cache hit, not a SELECT
+        return db.session.get(cls, by_id)
+
+    @classmethod
+    def find_many(cls, ids):
+        """Finds a batch of records by their IDs with a single query
+
+        Args:
+            ids (list): the ids of the records you want to match
+        """
+        logger.debug("Processing lookup for %d ids ...", len(ids))
+        return cls.query.filter(cls.id.in_(ids)).all()
 
 
 ######################################################################
@@ -88,24 +195,54 @@ class Account(db.Model, PersistentBase):
 
     # Table Schema
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(64))
+    name = db.Column(db.String(64), index=True)
     email = db.Column(db.String(64))
     address = db.Column(db.String(256))
     phone_number = db.Column(db.String(32), nullable=True)  # phone number is optional
-    date_joined = db.Column(db.Date(), nullable=False, default=date.today())
+    date_joined = db.Column(db.Date(), nullable=False, server_default=func.current_date())
+    # microsecond-precision client-side defaults keep the serialize cache
+    # key unique even when a database reuses row ids; server_default is
+    # the backstop for rows inserted outside the ORM
+    updated_at = db.Column(
+        db.DateTime(),
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=func.now(),
+    )
 
     def __repr__(self):
         return f"<Account {self.name} id=[{self.id}]>"
 
     def serialize(self):
-        """Serializes a Account into a dictionary"""
+        """Serializes a Account into a dictionary
+
+        Results for persisted rows are cached keyed on (id, updated_at),
+        so a row that hasn't changed costs a dict copy instead of
+        re-formatting every field.
+        """
+        if self.id is None:  # unpersisted rows have no stable cache key
+            return self._serialized()
+        key = (self.id, self.updated_at)
+        cached = _serialize_cache.get(key)
+        if cached is None:
+            cached = self._serialized()
+            _serialize_cache[key] = cached
+            if len(_serialize_cache) > _SERIALIZE_CACHE_MAX:
+                _serialize_cache.popitem(last=False)
+        else:
+            _serialize_cache.move_to_end(key)
+        return dict(cached)
+
+    def _serialized(self):
+        """Builds the serialized form of this Account"""
         return {
             "id": self.id,
             "name": self.name,
             "email": self.email,
             "address": self.address,
             "phone_number": self.phone_number,
-            "date_joined": self.date_joined.isoformat()
+            "date_joined": self.date_joined.isoformat(),
         }
 
     def deserialize(self, data):
@@ -116,122 +253,59 @@ class Account(db.Model, PersistentBase):
             data (dict): A dictionary containing the resource data
         """
         try:
-            self.name = data["name"]
-            self.email = data["email"]
-            self.address = data["address"]
-            self.phone_number = data.get("phone_number")
-            date_joined = data.get("date_joined")
-            if date_joined:
-                self.date_joined = date.fromisoformat(date_joined)
-            else:
-                self.date_joined = date.today()
-        except KeyError as error:
-            raise DataValidationError("Invalid Account: missing " + error.args[0]) from error
-        except TypeError as error:
-            raise DataValidationError(
-                "Invalid Account: body of request contained "
-                "bad or no data - " + error.args[0]
-            ) from error
+            parsed = AccountSchema.model_validate(data)
+        except ValidationError as error:
+            raise DataValidationError("Invalid Account: " + str(error)) from error
+        self.name = parsed.name
+        self.email = parsed.email
+        self.address = parsed.address
+        self.phone_number = parsed.phone_number
+        if parsed.date_joined:
+            self.date_joined = parsed.date_joined
+        # otherwise let the database fill in the server default
         return self
 
     @classmethod
-    def find_by_name(cls, name):
-        """Returns all Accounts with the given name
-
-        Args:
-            name (string): the name of the Accounts you want to match
-        """
-        logger.info("Processing name query for %s ...", name)
-        return cls.query.filter(cls.name == name)
-          @classmethod
-    def init_db(cls, app: Flask):
-        """Initializes the database session
-
-        :param app: the Flask app
-        :type data: Flask
-
-        """
-        logger.info("Initializing database")
-        # This is where we initialize SQLAlchemy from the Flask app
-        db.init_app(app)
-        app.app_context().push()
-        db.create_all()  # make our sqlalchemy tables
-
-    @classmethod
-    def all(cls) -> list:
-        """Returns all of the Products in the database"""
-        logger.info("Processing all Products")
-        return cls.query.all()
-
-    @classmethod
-    def find(cls, product_id: int):
-        """Finds a Product by it's ID
+    def summaries(cls, ids=None):
+        """Returns (id, name, email) rows without full-object hydration
 
-        :param product_id: the id of the Product to find
-        :type product_id: int
-
-        :return: an instance with the product_id, or None if not found
-        :rtype: Product
-
-        """
-        logger.info("Processing lookup for id %s ...", product_id)
-        return cls.query.get(product_id)
-
-    @classmethod
-    def find_by_name(cls, name: str) -> list:
-        """Returns all Products with the given name
-
-        :param name: the name of the Products you want to match
-        :type name: str
-
-        :return: a collection of Products with that name
-        :rtype: list
-
-        """
-        logger.info("Processing name query for %s ...", name)
-        return cls.query.filter(cls.name == name)
-
-    @classmethod
-    def find_by_price(cls, price: Decimal) -> list:
-        """Returns all Products with the given price
-
-        :param price: the price to search for
-        :type name: float
-
-        :return: a collection of Products with that price
-        :rtype: list
+        Uses a Core-level select so no ORM instances or identity-map
+        bookkeeping are created -- the cheap path for list endpoints that
+        don't need the wide address column or write access.
 
+        Args:
+            ids (list): restrict the listing to these ids (optional)
         """
-        logger.info("Processing price query for %s ...", price)
-        price_value = price
-        if isinstance(price, str):
-            price_value = Decimal(price.strip(' "'))
-        return cls.query.filter(cls.price == price_value)
+        logger.debug("Processing summary query")
+        stmt = select(cls.id, cls.name, cls.email)
+        if ids:
+            stmt = stmt.where(cls.id.in_(ids))
+        return db.session.execute(stmt).all()
 
     @classmethod
-    def find_by_availability(cls, available: bool = True) -> list:
-        """Returns all Products by their availability
-
-        :param available: True for products that are available
-        :type available: str
-
-        :return: a collection of Products that are available
-        :rtype: list
+    def find_by_name(cls, name, limit=None):
+        """Returns all Accounts with the given name
 
+        Args:
+            name (string): the name of the Accounts you want to match
+            limit (int): cap the number of rows fetched (optional); without
+                it a common name pulls every matching row into memory
         """
-        logger.info("Processing available query for %s ...", available)
-        return cls.query.filter(cls.available == available)
+        logger.debug("Processing name query for %s ...", name)
+        query = cls.query.filter(cls.name == name)
+        if limit:
+            query = query.limit(limit)
+        return query
 
     @classmethod
-    def find_by_category(cls, category: Category = Category.UNKNOWN) -> list:
-        """Returns all Products by their Category
+    def find_first_by_name(cls, name):
+        """Returns the first Account with the given name, or None
 
-        :param category: values are ['MALE', 'FEMALE', 'UNKNOWN']
-        :type available: enum
-
-        :return: a collection of Products that are available
-        :rtype: list
+        Fetches a single row in one round-trip instead of materializing
+        the full result set.
 
+        Args:
+            name (string): the name of the Account you want to match
         """
-        logger.info("Processing category query for %s ...", category.name)
-        return cls.query.filter(cls.category == category)
+        logger.debug("Processing first-match name query for %s ...", name)
+        return cls.query.filter(cls.name == name).first()
@@ -15,7 +15,7 @@ class AccountFactory(factory.Factory):
         """Persistent class for factory"""
         model = Account
 
-    id = factory.Sequence(lambda n: n)
+    id = None  # primary keys are assigned by the database
     name = factory.Faker("name")
     email = factory.Faker("email")
     address = factory.Faker("address")
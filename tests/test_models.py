@@ -5,8 +5,10 @@ Test cases for Account Model
 import logging
 import unittest
 import os
+from datetime import date
+from sqlalchemy import event
 from service import app
-from service.models import Account, DataValidationError, db
+from service.models import Account, DataValidationError, db, unit_of_work
 from tests.factories import AccountFactory
 
 DATABASE_URI = os.getenv(
@@ -28,19 +30,59 @@ class TestAccount(unittest.TestCase):
         app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URI
         app.logger.setLevel(logging.CRITICAL)
         Account.init_db(app)
+        if db.engine.dialect.name == "sqlite":
+            # pysqlite disables transactional SAVEPOINTs by default; take
+            # over transaction control so the rollback fixture works on
+            # file-based SQLite. In-memory SQLite still won't work: its
+            # StaticPool shares a single connection, so the per-test
+            # db.engine.connect() cannot isolate an outer transaction.
+            @event.listens_for(db.engine, "connect")
+            def _sqlite_connect(dbapi_connection, _connection_record):
+                dbapi_connection.isolation_level = None
+
+            @event.listens_for(db.engine, "begin")
+            def _sqlite_begin(connection):
+                connection.exec_driver_sql("BEGIN")
+        db.session.query(Account).delete()  # clean up from prior runs
+        db.session.commit()
+        # Seed a canonical batch once for the whole class; the rollback
+        # fixture keeps per-test mutations from ever touching it, so the
+        # Faker cost is paid once instead of once per test
+        cls.seed_accounts = AccountFactory.create_batch(10)
+        Account.create_all(cls.seed_accounts)
+        for account in cls.seed_accounts:
+            account.serialize()  # reload attributes expired by the commit
 
     @classmethod
     def tearDownClass(cls):
         """This runs once after the entire test suite"""
 
     def setUp(self):
-        """This runs before each test"""
-        db.session.query(Account).delete()  # clean up the last tests
-        db.session.commit()
+        """This runs before each test
+
+        Each test runs inside an outer transaction that is rolled back in
+        tearDown(), so nothing a test writes survives it. Commits inside a
+        test only release a SAVEPOINT, which is immediately restarted.
+        """
+        self.connection = db.engine.connect()
+        self.transaction = self.connection.begin()
+        self.original_session = db.session
+        db.session = db.create_scoped_session(
+            options={"bind": self.connection, "binds": {}}
+        )
+        self.savepoint = self.connection.begin_nested()
+
+        @event.listens_for(db.session, "after_transaction_end")
+        def _restart_savepoint(_session, _transaction):
+            if not self.savepoint.is_active and self.connection.in_transaction():
+                self.savepoint = self.connection.begin_nested()
 
     def tearDown(self):
         """This runs after each test"""
         db.session.remove()
+        self.transaction.rollback()
+        self.connection.close()
+        db.session = self.original_session
 
     ######################################################################
     #  T E S T   C A S E S
@@ -68,18 +110,17 @@ class TestAccount(unittest.TestCase):
     def test_add_a_account(self):
         """It should Create an account and add it to the database"""
         accounts = Account.all()
-        self.assertEqual(accounts, [])
+        self.assertEqual(len(accounts), len(self.seed_accounts))
         account = AccountFactory()
         account.create()
         # Assert that it was assigned an id and shows up in the database
         self.assertIsNotNone(account.id)
         accounts = Account.all()
-        self.assertEqual(len(accounts), 1)
+        self.assertEqual(len(accounts), len(self.seed_accounts) + 1)
 
     def test_read_account(self):
         """It should Read an account"""
-        account = AccountFactory()
-        account.create()
+        account = self.seed_accounts[0]
 
         # Read it back
         found_account = Account.find(account.id)
@@ -90,6 +131,15 @@ class TestAccount(unittest.TestCase):
         self.assertEqual(found_account.phone_number, account.phone_number)
         self.assertEqual(found_account.date_joined, account.date_joined)
 
+    def test_find_many_accounts(self):
+        """It should Find a batch of accounts with a single query"""
+        wanted = self.seed_accounts[:3]
+        found = Account.find_many([account.id for account in wanted])
+        self.assertEqual(
+            {account.id for account in found}, {account.id for account in wanted}
+        )
+        self.assertEqual(Account.find_many([0]), [])
+
     def test_update_account(self):
         """It should Update an account"""
         account = AccountFactory(email="advent@change.me")
@@ -109,39 +159,88 @@ class TestAccount(unittest.TestCase):
 
     def test_delete_an_account(self):
         """It should Delete an account from the database"""
-        accounts = Account.all()
-        self.assertEqual(accounts, [])
-        account = AccountFactory()
-        account.create()
-        # Assert that it was assigned an id and shows up in the database
-        self.assertIsNotNone(account.id)
-        accounts = Account.all()
-        self.assertEqual(len(accounts), 1)
-        account = accounts[0]
+        account = Account.find(self.seed_accounts[0].id)
         account.delete()
         accounts = Account.all()
-        self.assertEqual(len(accounts), 0)
+        self.assertEqual(len(accounts), len(self.seed_accounts) - 1)
 
     def test_list_all_accounts(self):
         """It should List all Accounts in the database"""
         accounts = Account.all()
-        self.assertEqual(accounts, [])
-        for account in AccountFactory.create_batch(5):
-            account.create()
-        # Assert that there are not 5 accounts in the database
+        self.assertEqual(len(accounts), len(self.seed_accounts))
+        Account.create_all(AccountFactory.create_batch(5))
         accounts = Account.all()
-        self.assertEqual(len(accounts), 5)
+        self.assertEqual(len(accounts), len(self.seed_accounts) + 5)
+
+    def test_bulk_save_accounts(self):
+        """It should persist a batch without ORM bookkeeping"""
+        Account.bulk_save(AccountFactory.create_batch(5))
+        accounts = Account.all()
+        self.assertEqual(len(accounts), len(self.seed_accounts) + 5)
+
+    def test_list_summaries(self):
+        """It should List summary rows without hydrating full objects"""
+        summaries = Account.summaries()
+        self.assertEqual(len(summaries), len(self.seed_accounts))
+        names = {summary.name for summary in summaries}
+        self.assertEqual(names, {account.name for account in self.seed_accounts})
+
+        # restricting by id returns only the matching rows
+        subset = Account.summaries(ids=[self.seed_accounts[0].id])
+        self.assertEqual(len(subset), 1)
+        self.assertEqual(subset[0].id, self.seed_accounts[0].id)
+
+    def test_all_with_columns(self):
+        """It should List accounts with only the requested columns loaded"""
+        accounts = Account.all(columns=[Account.name, Account.email])
+        self.assertEqual(len(accounts), len(self.seed_accounts))
+        self.assertEqual(
+            {account.name for account in accounts},
+            {account.name for account in self.seed_accounts},
+        )
+
+    def test_unit_of_work_batches_commits(self):
+        """It should persist several writes with one commit"""
+        accounts = AccountFactory.create_batch(2)
+        with unit_of_work():
+            for account in accounts:
+                account.create()
+        self.assertEqual(len(Account.all()), len(self.seed_accounts) + 2)
+
+    def test_unit_of_work_rolls_back_on_error(self):
+        """It should roll back every write when the block raises"""
+        account = AccountFactory()
+        with self.assertRaises(DataValidationError):
+            with unit_of_work():
+                account.create()
+                raise DataValidationError("boom")
+        self.assertEqual(len(Account.all()), len(self.seed_accounts))
 
     def test_find_by_name(self):
         """It should Find an Account by name"""
-        account = AccountFactory()
-        account.create()
+        account = self.seed_accounts[0]
 
         # Fetch it back by name
         same_account = Account.find_by_name(account.name)[0]
         self.assertEqual(same_account.id, account.id)
         self.assertEqual(same_account.name, account.name)
 
+    def test_find_by_name_with_limit(self):
+        """It should cap the rows returned when a limit is given"""
+        accounts = AccountFactory.create_batch(3, name="Same Name")
+        Account.create_all(accounts)
+
+        found = Account.find_by_name("Same Name", limit=2).all()
+        self.assertEqual(len(found), 2)
+
+    def test_find_first_by_name(self):
+        """It should Find the first Account with a given name"""
+        account = self.seed_accounts[0]
+
+        found = Account.find_first_by_name(account.name)
+        self.assertEqual(found.id, account.id)
+        self.assertIsNone(Account.find_first_by_name("no such name"))
+
     def test_serialize_an_account(self):
         """It should Serialize an account"""
         account = AccountFactory()
@@ -153,6 +252,14 @@ class TestAccount(unittest.TestCase):
         self.assertEqual(serial_account["phone_number"], account.phone_number)
         self.assertEqual(serial_account["date_joined"], str(account.date_joined))
 
+    def test_serialize_cache_returns_copies(self):
+        """It should not let callers mutate the cached serialization"""
+        account = self.seed_accounts[0]
+        first = account.serialize()
+        first["name"] = "mutated"
+        second = account.serialize()
+        self.assertEqual(second["name"], account.name)
+
     def test_deserialize_an_account(self):
         """It should Deserialize an account"""
         account = AccountFactory()
@@ -166,6 +273,14 @@ class TestAccount(unittest.TestCase):
         self.assertEqual(new_account.phone_number, account.phone_number)
         self.assertEqual(new_account.date_joined, account.date_joined)
 
+    def test_deserialize_without_date_joined(self):
+        """It should let the database default date_joined when omitted"""
+        data = AccountFactory().serialize()
+        del data["date_joined"]
+        account = Account().deserialize(data)
+        account.create()
+        self.assertEqual(account.date_joined, date.today())
+
     def test_deserialize_with_key_error(self):
         """It should not Deserialize an account with a KeyError"""
         account = Account()
@@ -175,126 +290,3 @@ class TestAccount(unittest.TestCase):
         """It should not Deserialize an account with a TypeError"""
         account = Account()
         self.assertRaises(DataValidationError, account.deserialize, [])
-        ######################################################################
-    #  T E S T   C A S E S
-    ######################################################################
-
-    def test_create_a_product(self):
-        """It should Create a product and assert that it exists"""
-        product = Product(name="Fedora", description="A red hat", price=12.50, available=True, category=Category.CLOTHS)
-        self.assertEqual(str(product), "<Product Fedora id=[None]>")
-        self.assertTrue(product is not None)
-        self.assertEqual(product.id, None)
-        self.assertEqual(product.name, "Fedora")
-        self.assertEqual(product.description, "A red hat")
-        self.assertEqual(product.available, True)
-        self.assertEqual(product.price, 12.50)
-        self.assertEqual(product.category, Category.CLOTHS)
-
-    def test_add_a_product(self):
-        """It should Create a product and add it to the database"""
-        products = Product.all()
-        self.assertEqual(products, [])
-        product = ProductFactory()
-        product.id = None
-        product.create()
-        # Assert that it was assigned an id and shows up in the database
-        self.assertIsNotNone(product.id)
-        products = Product.all()
-        self.assertEqual(len(products), 1)
-        # Check that it matches the original product
-        new_product = products[0]
-        self.assertEqual(new_product.name, product.name)
-        self.assertEqual(new_product.description, product.description)
-        self.assertEqual(Decimal(new_product.price), product.price)
-        self.assertEqual(new_product.available, product.available)
-        self.assertEqual(new_product.category, product.category)
-
-    def test_read_a_product(self):
-        """It should Read a Product"""
-        product = ProductFactory()
-        product.id = None
-        product.create()
-        self.assertIsNotNone(product.id)
-        # Fetch it back
-        found_product = Product.find(product.id)
-        self.assertEqual(found_product.id, product.id)
-        self.assertEqual(found_product.name, product.name)
-        self.assertEqual(found_product.description, product.description)
-        self.assertEqual(found_product.price, product.price)
-        
-   def test_update_a_product(self):
-        """It should Update a Product"""
-        product = ProductFactory()
-        product.id = None
-        product.create()
-        self.assertIsNotNone(product.id)
-        # Change it an save it
-        product.description = "testing"
-        original_id = product.id
-        product.update()
-        self.assertEqual(product.id, original_id)
-        self.assertEqual(product.description, "testing")
-        # Fetch it back and make sure the id hasn't changed
-        # but the data did change
-        products = Product.all()
-        self.assertEqual(len(products), 1)
-        self.assertEqual(products[0].id, original_id)
-        self.assertEqual(products[0].description, "testing")
-
-    def test_delete_a_product(self):
-        """It should Delete a Product"""
-        product = ProductFactory()
-        product.create()
-        self.assertEqual(len(Product.all()), 1)
-        # delete the product and make sure it isn't in the database
-        product.delete()
-        self.assertEqual(len(Product.all()), 0)
-
-    def test_list_all_products(self):
-        """It should List all Products in the database"""
-        products = Product.all()
-        self.assertEqual(products, [])
-        # Create 5 Products
-        for _ in range(5):
-            product = ProductFactory()
-            product.create()
-        # See if we get back 5 products
-        products = Product.all()
-        self.assertEqual(len(products), 5)
-
-    def test_find_by_name(self):
-        """It should Find a Product by Name"""
-        products = ProductFactory.create_batch(5)
-        for product in products:
-            product.create()
-        name = products[0].name
-        count = len([product for product in products if product.name == name])
-        found = Product.find_by_name(name)
-        self.assertEqual(found.count(), count)
-        for product in found:
-            self.assertEqual(product.name, name)
-
-     def test_find_by_availability(self):
-        """It should Find Products by Availability"""
-        products = ProductFactory.create_batch(10)
-        for product in products:
-            product.create()
-        available = products[0].available
-        count = len([product for product in products if product.available == available])
-        found = Product.find_by_availability(available)
-        self.assertEqual(found.count(), count)
-        for product in found:
-            self.assertEqual(product.available, available)
-
-    def test_find_by_category(self):
-        """It should Find Products by Category"""
-        products = ProductFactory.create_batch(10)
-        for product in products:
-            product.create()
-        category = products[0].category
-        count = len([product for product in products if product.category == category])
-        found = Product.find_by_category(category)
-        self.assertEqual(found.count(), count)
-        for product in found:
-            self.assertEqual(product.category, category)